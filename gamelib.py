@@ -2,6 +2,7 @@
 The gamelib module defines abstract classes necessary for implementing simple
 games based on tkinter's canvas.
 """
+import time
 import tkinter as tk
 from abc import ABC, abstractmethod
 
@@ -12,6 +13,8 @@ class GameElement(ABC):
     be displayed on the game's screen
     """
 
+    __slots__ = ("__game", "__x", "__y")
+
     def __init__(self, game: "Game"):
         self.__game: "Game" = game
         self.__x: float = 0
@@ -82,15 +85,26 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
     """
     An abstract class to be implemented with a concrete game class that relies
     on update/render loop
+
+    Elements are updated in fixed time steps of update_delay milliseconds,
+    independent of how often frames are scheduled (every frame_delay
+    milliseconds, or later if Tk is busy); a frame renders the elements only
+    if at least one step has run since the previous frame.
     """
 
-    def __init__(self, parent, update_delay=33):
+    # longest stretch of time (in seconds) caught up on in a single frame
+    MAX_FRAME_TIME = 0.25
+
+    def __init__(self, parent, update_delay=33, frame_delay=16):
         super().__init__(parent)
         self.__canvas = tk.Canvas(self)
         self.__canvas.pack(expand=True, fill="both")
         self.pack(expand=True, fill="both")
         self.__game_elements = []
-        self.__update_delay = update_delay
+        self.__time_step = update_delay / 1000
+        self.__frame_delay = frame_delay
+        self.__accumulator = 0.0
+        self.__last_time = 0.0
         self.__started = False
         self.init_game()
 
@@ -100,6 +114,12 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         Create game elements and initialize other game-specific attributes
         """
 
+    def update_game(self) -> None:
+        """
+        Update game-wide states once per fixed time step, before the game
+        elements are updated; does nothing unless overridden
+        """
+
     @abstractmethod
     def game_over_win(self) -> None:
         """
@@ -133,6 +153,13 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         return self.__canvas
 
+    @property
+    def time_step(self) -> float:
+        """
+        Get the duration of one update step in seconds
+        """
+        return self.__time_step
+
     @property
     def is_started(self) -> bool:
         """
@@ -146,6 +173,8 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         if not self.__started:
             self.__started = True
+            self.__accumulator = 0.0
+            self.__last_time = time.perf_counter()
             self.animate()
 
     def stop(self) -> None:
@@ -156,10 +185,21 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
 
     def animate(self):
         """
-        Update and render all game's elements
-        """
-        for element in self.__game_elements:
-            element.update()
-            element.render()
+        Update all game's elements for every fixed time step elapsed since
+        the previous frame, then render them once if anything was updated
+        """
+        now = time.perf_counter()
+        self.__accumulator += min(now - self.__last_time, self.MAX_FRAME_TIME)
+        self.__last_time = now
+        stepped = False
+        while self.__started and self.__accumulator >= self.__time_step:
+            self.update_game()
+            for element in self.__game_elements:
+                element.update()
+            self.__accumulator -= self.__time_step
+            stepped = True
+        if stepped:
+            for element in self.__game_elements:
+                element.render()
         if self.__started:
-            self.after(self.__update_delay, self.animate)
+            self.after(self.__frame_delay, self.animate)
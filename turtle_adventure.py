@@ -2,11 +2,28 @@
 The turtle_adventure module maintains all classes related to the Turtle's
 adventure game.
 """
-from turtle import RawTurtle
+from abc import abstractmethod
+from collections.abc import Callable
 import random
 import math
 from gamelib import Game, GameElement
 
+# lookup tables for integer-degree directions
+_COS = tuple(math.cos(math.radians(d)) for d in range(360))
+_SIN = tuple(math.sin(math.radians(d)) for d in range(360))
+
+# outline of the player's turtle sprite facing east, in pixels relative to its
+# position
+_TURTLE_SHAPE = ((16, 0), (14, -2), (10, -1), (7, -4), (9, -7), (8, -9),
+                 (5, -6), (1, -7), (-3, -5), (-6, -8), (-8, -6), (-5, -4),
+                 (-7, 0), (-5, 4), (-8, 6), (-6, 8), (-3, 5), (1, 7), (5, 6),
+                 (8, 9), (9, 7), (7, 4), (10, 1), (14, 2))
+
+# module-level bindings of math functions used by per-tick updates
+_sin = math.sin
+_hypot = math.hypot
+_sqrt = math.sqrt
+
 
 class TurtleGameElement(GameElement):
     """
@@ -14,6 +31,8 @@ class TurtleGameElement(GameElement):
     Adventure game
     """
 
+    __slots__ = ("__game",)
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
         self.__game: "TurtleAdventureGame" = game
@@ -31,15 +50,25 @@ class Waypoint(TurtleGameElement):
     Represent the waypoint to which the player will move.
     """
 
+    __slots__ = ("__id1", "__id2", "__active", "__dirty")
+
+    TAG = "waypoint"  # canvas tag shared by both lines of the cross
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
         self.__id1: int
         self.__id2: int
         self.__active: bool = False
+        self.__dirty: bool = True  # whether canvas items need redrawing
 
     def create(self) -> None:
-        self.__id1 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green")
-        self.__id2 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green")
+        self.__id1 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green",
+                                             tags=self.TAG)
+        self.__id2 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green",
+                                             tags=self.TAG)
+        # stack the waypoint above everything once; enemies are created
+        # beneath existing items, so it never needs raising again
+        self.canvas.tag_raise(self.TAG)
 
     def delete(self) -> None:
         self.canvas.delete(self.__id1)
@@ -50,24 +79,24 @@ class Waypoint(TurtleGameElement):
         pass
 
     def render(self) -> None:
+        if not self.__dirty:
+            return
+        self.__dirty = False
         if self.is_active:
-            self.canvas.itemconfigure(self.__id1, state="normal")
-            self.canvas.itemconfigure(self.__id2, state="normal")
-            self.canvas.tag_raise(self.__id1)
-            self.canvas.tag_raise(self.__id2)
+            self.canvas.itemconfigure(self.TAG, state="normal")
             self.canvas.coords(self.__id1, self.x - 10, self.y - 10,
                                self.x + 10, self.y + 10)
             self.canvas.coords(self.__id2, self.x - 10, self.y + 10,
                                self.x + 10, self.y - 10)
         else:
-            self.canvas.itemconfigure(self.__id1, state="hidden")
-            self.canvas.itemconfigure(self.__id2, state="hidden")
+            self.canvas.itemconfigure(self.TAG, state="hidden")
 
     def activate(self, x: float, y: float) -> None:
         """
         Activate this waypoint with the specified location.
         """
         self.__active = True
+        self.__dirty = True
         self.x = x
         self.y = y
 
@@ -76,6 +105,7 @@ class Waypoint(TurtleGameElement):
         Mark this waypoint as inactive.
         """
         self.__active = False
+        self.__dirty = True
 
     @property
     def is_active(self) -> bool:
@@ -90,15 +120,40 @@ class Home(TurtleGameElement):
     Represent the player's home.
     """
 
+    __slots__ = ("__id", "__size", "__bounds", "__dirty")
+
     def __init__(self, game: "TurtleAdventureGame", pos: tuple[int, int],
                  size: int):
         super().__init__(game)
         self.__id: int
         self.__size: int = size
+        self.__bounds: tuple[float, float, float, float]
+        self.__dirty: bool  # whether the canvas item needs redrawing
         x, y = pos
         self.x = x
         self.y = y
 
+    def __update_bounds(self) -> None:
+        """
+        Recompute home's corners after its position or size has changed
+        """
+        half = self.__size / 2
+        x, y = self.x, self.y
+        self.__bounds = (x - half, y - half, x + half, y + half)
+        self.__dirty = True
+
+    # override original property x's setter to keep home's bounds up to date
+    @GameElement.x.setter
+    def x(self, val: float) -> None:
+        GameElement.x.fset(self, val)
+        self.__update_bounds()
+
+    # override original property y's setter to keep home's bounds up to date
+    @GameElement.y.setter
+    def y(self, val: float) -> None:
+        GameElement.y.fset(self, val)
+        self.__update_bounds()
+
     @property
     def size(self) -> int:
         """
@@ -109,6 +164,7 @@ class Home(TurtleGameElement):
     @size.setter
     def size(self, val: int) -> None:
         self.__size = val
+        self.__update_bounds()
 
     def create(self) -> None:
         self.__id = self.canvas.create_rectangle(0, 0, 0, 0, outline="brown",
@@ -122,42 +178,37 @@ class Home(TurtleGameElement):
         pass
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
+        if self.__dirty:
+            self.canvas.coords(self.__id, *self.__bounds)
+            self.__dirty = False
 
     def contains(self, x: float, y: float):
         """
         Check whether home contains the point (x, y).
         """
-        x1, x2 = self.x - self.size / 2, self.x + self.size / 2
-        y1, y2 = self.y - self.size / 2, self.y + self.size / 2
+        x1, y1, x2, y2 = self.__bounds
         return x1 <= x <= x2 and y1 <= y <= y2
 
 
 class Player(TurtleGameElement):
     """
-    Represent the main player, implemented using Python's turtle.
+    Represent the main player, drawn as a turtle-shaped canvas polygon.
     """
 
+    __slots__ = ("__speed", "__id", "__heading")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
-                 turtle: RawTurtle,
                  speed: float = 5):
         super().__init__(game)
         self.__speed: float = speed
-        self.__turtle: RawTurtle = turtle
+        self.__id: int
+        # unit vector of the direction the turtle is facing
+        self.__heading: tuple[float, float] = (1.0, 0.0)
 
     def create(self) -> None:
-        turtle = RawTurtle(self.canvas)
-        turtle.getscreen().tracer(False)  # disable turtle's built-in animation
-        turtle.shape("turtle")
-        turtle.color("green")
-        turtle.penup()
-
-        self.__turtle = turtle
+        self.__id = self.canvas.create_polygon(0, 0, 0, 0, 0, 0,
+                                               fill="green")
 
     @property
     def speed(self) -> float:
@@ -171,43 +222,35 @@ class Player(TurtleGameElement):
         self.__speed = val
 
     def delete(self) -> None:
-        pass
+        self.canvas.delete(self.__id)
 
     def update(self) -> None:
         # check if player has arrived home
         if self.game.home.contains(self.x, self.y):
             self.game.game_over_win()
-        turtle = self.__turtle
         waypoint = self.game.waypoint
-        if self.game.waypoint.is_active:
-            turtle.setheading(turtle.towards(waypoint.x, waypoint.y))
-            turtle.forward(self.speed)
-            if turtle.distance(waypoint.x, waypoint.y) < self.speed:
+        if waypoint.is_active:
+            speed = self.__speed
+            x, y = self.x, self.y
+            dx, dy = waypoint.x - x, waypoint.y - y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq < speed * speed:
                 waypoint.deactivate()
+            else:
+                distance = _sqrt(distance_sq)
+                cos_h, sin_h = dx / distance, dy / distance
+                self.__heading = (cos_h, sin_h)
+                self.x = x + cos_h * speed
+                self.y = y + sin_h * speed
 
     def render(self) -> None:
-        self.__turtle.goto(self.x, self.y)
-        self.__turtle.getscreen().update()
-
-    # override original property x's getter/setter to use turtle's methods
-    # instead
-    @property
-    def x(self) -> float:
-        return self.__turtle.xcor()
-
-    @x.setter
-    def x(self, val: float) -> None:
-        self.__turtle.setx(val)
-
-    # override original property y's getter/setter to use turtle's methods
-    # instead
-    @property
-    def y(self) -> float:
-        return self.__turtle.ycor()
-
-    @y.setter
-    def y(self, val: float) -> None:
-        self.__turtle.sety(val)
+        cos_h, sin_h = self.__heading
+        x, y = self.x, self.y
+        coords = []
+        for px, py in _TURTLE_SHAPE:
+            coords.append(x + px * cos_h - py * sin_h)
+            coords.append(y + px * sin_h + py * cos_h)
+        self.canvas.coords(self.__id, coords)
 
 
 class Enemy(TurtleGameElement):
@@ -215,6 +258,9 @@ class Enemy(TurtleGameElement):
     Define an abstract enemy for the Turtle's adventure game
     """
 
+    __slots__ = ("__size", "__color", "_half", "_screen_width",
+                 "_screen_height", "__id")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -222,6 +268,10 @@ class Enemy(TurtleGameElement):
         super().__init__(game)
         self.__size = size
         self.__color = color
+        self._half = size / 2
+        self._screen_width = game.screen_width
+        self._screen_height = game.screen_height
+        self.__id: int
 
     @property
     def size(self) -> float:
@@ -237,17 +287,33 @@ class Enemy(TurtleGameElement):
         """
         return self.__color
 
+    @abstractmethod
+    def create_item(self) -> int:
+        """
+        Create the canvas item representing this enemy and return its id
+        """
+
+    def create(self) -> None:
+        self.__id = self.create_item()
+        # keep enemies beneath the player, home and waypoint
+        self.canvas.tag_lower(self.__id)
+
+    def render(self) -> None:
+        self.game.queue_coords(self.__id, self.x - self._half,
+                               self.y - self._half, self.x + self._half,
+                               self.y + self._half)
+
+    def delete(self) -> None:
+        self.canvas.delete(self.__id)
+
     def hits_player(self):  # return bool
         """
         Check whether the enemy is hitting the player
         """
-        return (
-                (
-                            self.x - self.size / 2 < self.game.player.x < self.x + self.size / 2)
-                and
-                (
-                            self.y - self.size / 2 < self.game.player.y < self.y + self.size / 2)
-        )
+        player = self.game.player
+        half = self._half
+        return (abs(player.x - self.x) < half
+                and abs(player.y - self.y) < half)
 
 
 # * Define your enemy classes
@@ -260,145 +326,143 @@ class DemoEnemy(Enemy):
     Demo enemy
     """
 
+    __slots__ = ("direction",)
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str):
         super().__init__(game, size, color)
-        self.__id = None
         self.direction = 1  # Initial direction
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
+    def create_item(self) -> int:
+        return self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
 
     def update(self) -> None:
-        self.x += 1  # walk straight
-        self.y += 1
+        x = self.x + 1  # walk straight
+        y = self.y + 1
+        self.x = x
+        self.y = y
 
-        if self.x >= self.game.screen_width or self.x <= 0:
+        if x >= self._screen_width or x <= 0:
             self.direction *= -1
-        if self.y >= self.game.screen_height or self.y <= 0:
+        if y >= self._screen_height or y <= 0:
             self.direction *= -1
 
         if self.hits_player():
             self.game.game_over_lose()
 
-    def render(self) -> None:
-        self.canvas.coords(self.__id, self.x - self.size / 2,
-                           self.y - self.size / 2, self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        # self.canvas.delete(self.__id)
-        pass
-
 
 class RandomWalkEnemy(Enemy):
     """
     Random walk enemy
     """
 
+    __slots__ = ("speed", "direction")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str,
                  speed: float = 3):
         super().__init__(game, size, color)
-        self.__id = None
         self.speed = speed
-        self.direction = random.randint(0, 360)
+        self.direction = random.randrange(360)
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color)
+    def create_item(self) -> int:
+        return self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color)
 
     def update(self) -> None:
-        self.x += self.speed * math.cos(math.radians(self.direction))
-        self.y += self.speed * math.sin(math.radians(self.direction))
+        half = self._half
+        width, height = self._screen_width, self._screen_height
+        direction = self.direction
+        x = self.x + self.speed * _COS[direction]
+        y = self.y + self.speed * _SIN[direction]
 
         # horizontal frame
-        if (self.x + self.size / 2 >= self.game.screen_width or
-                self.x - self.size / 2 <= 0):
-            self.direction = 180 - self.direction
+        if x + half >= width or x - half <= 0:
+            direction = (180 - direction) % 360
             # flip direction if hits
 
             # adjust position to prevent going out of bounds
-            if self.x + self.size / 2 >= self.game.screen_width:
-                self.x = self.game.screen_width - self.size / 2
-            elif self.x - self.size / 2 <= 0:
-                self.x = self.size / 2
+            if x + half >= width:
+                x = width - half
+            elif x - half <= 0:
+                x = half
 
         # vertical frame
-        if (self.y + self.size / 2 >= self.game.screen_height or
-                self.y - self.size / 2 <= 0):
-            self.direction = -self.direction
+        if y + half >= height or y - half <= 0:
+            direction = -direction % 360
 
             # adjust the position to prevent going out of bounds
-            if self.y + self.size / 2 >= self.game.screen_height:
-                self.y = self.game.screen_height - self.size / 2
-            elif self.y - self.size / 2 <= 0:
-                self.y = self.size / 2
+            if y + half >= height:
+                y = height - half
+            elif y - half <= 0:
+                y = half
+
+        self.x = x
+        self.y = y
+        self.direction = direction
 
         if self.hits_player():
             self.game.game_over_lose()
 
-    def render(self) -> None:
-        self.canvas.coords(self.__id, self.x - self.size / 2,
-                           self.y - self.size / 2, self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        self.canvas.delete(self.__id)
-
 
 class ChasingEnemy(Enemy):
     """
     Chasing enemy
     """
 
+    __slots__ = ("speed",)
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str,
                  speed: float = 2):
         super().__init__(game, size, color)
-        self.__id = None
         self.speed = speed  # Enemy's speed is 1
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
+    def create_item(self) -> int:
+        return self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
 
     def update(self) -> None:
-        player_x, player_y = self.game.player.x, self.game.player.y
-        direction = math.atan2(player_y - self.y, player_x - self.x)
-        self.x += math.cos(direction) * self.speed
-        self.y += math.sin(direction) * self.speed
+        half = self._half
+        player = self.game.player
+        x, y = self.x, self.y
+        dx, dy = player.x - x, player.y - y
+        distance = _hypot(dx, dy)
+        if distance > 0:
+            # move speed units along the unit vector toward the player
+            step = self.speed / distance
+            x += dx * step
+            y += dy * step
 
         # Check if the enemy is going out of the screen boundaries
-        if self.x - self.size / 2 < 0:
-            self.x = self.size / 2  # prevent going out of bounds
-        elif self.x + self.size / 2 > self.game.screen_width:
-            self.x = self.game.screen_width - self.size / 2
-        if self.y - self.size / 2 < 0:
-            self.y = self.size / 2
-        elif self.y + self.size / 2 > self.game.screen_height:
-            self.y = self.game.screen_height - self.size / 2
+        if x - half < 0:
+            x = half  # prevent going out of bounds
+        elif x + half > self._screen_width:
+            x = self._screen_width - half
+        if y - half < 0:
+            y = half
+        elif y + half > self._screen_height:
+            y = self._screen_height - half
+
+        self.x = x
+        self.y = y
 
         if self.hits_player():
             self.game.game_over_lose()
 
-    def render(self) -> None:
-        self.canvas.coords(self.__id, self.x - self.size / 2,
-                           self.y - self.size / 2, self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        self.canvas.delete(self.__id)
-
 
 class FencingEnemy(Enemy):
     """
     *walk around the home in a square-like pattern* enemy
     """
+
+    __slots__ = ("__sides", "__side_length", "__perimeter", "__distance",
+                 "speed")
+
     HOME_OFFSET = 20
 
     def __init__(self,
@@ -407,53 +471,40 @@ class FencingEnemy(Enemy):
                  color: str,
                  speed: float = 1):
         super().__init__(game, size, color)
-        self.__directions = [(1, 0), (0, 1), (-1, 0),
-                             (0, -1)]  # right, down, left, up
-        self.__current_direction_index = 0
-        self.__home_x = self.game.home.x
-        self.__home_y = self.game.home.y
-        self.__offset = self.HOME_OFFSET + self.game.home.size / 2
-        self.x = self.__home_x - self.__offset
-        self.y = self.__home_y - self.__offset
+        home_x, home_y = self.game.home.x, self.game.home.y
+        offset = self.HOME_OFFSET + self.game.home.size / 2
+        left, right = home_x - offset, home_x + offset
+        top, bottom = home_y - offset, home_y + offset
+        # starting corner and direction of each side: right, down, left, up
+        self.__sides = ((left, top, 1, 0), (right, top, 0, 1),
+                        (right, bottom, -1, 0), (left, bottom, 0, -1))
+        self.__side_length = 2 * offset
+        self.__perimeter = 4 * self.__side_length
+        self.__distance = 0.0  # distance walked along the fence so far
+        self.x = left
+        self.y = top
         self.speed = speed
-        self.__id = None
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
+    def create_item(self) -> int:
+        return self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
 
     def update(self) -> None:
-        dx, dy = self.__directions[self.__current_direction_index]
-        self.x += dx * self.speed
-        self.y += dy * self.speed
-
-        if self.x >= self.__home_x + self.__offset and dx == 1:  # right border
-            self.__current_direction_index \
-                = (self.__current_direction_index + 1) % 4
-        elif self.x <= self.__home_x - self.__offset and dx == -1:  # left border
-            self.__current_direction_index \
-                = (self.__current_direction_index + 1) % 4
-        elif self.y >= self.__home_y + self.__offset and dy == 1:  # bottom border
-            self.__current_direction_index \
-                = (self.__current_direction_index + 1) % 4
-        elif self.y <= self.__home_y - self.__offset and dy == -1:  # top border
-            self.__current_direction_index \
-                = (self.__current_direction_index + 1) % 4
+        # the position is a function of the distance walked around the fence
+        self.__distance = (self.__distance + self.speed) % self.__perimeter
+        side, along = divmod(self.__distance, self.__side_length)
+        x0, y0, dx, dy = self.__sides[int(side) % 4]
+        self.x = x0 + dx * along
+        self.y = y0 + dy * along
 
         if self.hits_player():
             self.game.game_over_lose()
 
-    def render(self) -> None:
-        self.canvas.coords(self.__id, self.x - self.size / 2,
-                           self.y - self.size / 2, self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        self.canvas.delete(self.__id)
-
 
 class SinEnemy(Enemy):
     """Sin enemy"""
 
+    __slots__ = ("__amplitude", "__frequency", "__speed")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -463,48 +514,43 @@ class SinEnemy(Enemy):
         self.__amplitude = 50
         self.__frequency = 0.02
         self.__speed = speed
-        self.__id = None
 
         self.x = 0
         self.y = self.game.screen_height / 4
 
-    def create(self) -> None:
-        self.__id = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color)
+    def create_item(self) -> int:
+        return self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color)
 
     def update(self) -> None:
-        self.x += self.__speed
-        self.y += self.__amplitude * math.sin(self.__frequency * self.x)
+        half = self._half
+        x = self.x + self.__speed
+        y = self.y + self.__amplitude * _sin(self.__frequency * x)
 
-        if self.x - self.size / 2 < 0:
-            self.x = self.size / 2
+        if x - half < 0:
+            x = half
             self.__speed *= -1
-        elif self.x + self.size / 2 > self.game.screen_width:
-            self.x = self.game.screen_width - self.size / 2
+        elif x + half > self._screen_width:
+            x = self._screen_width - half
             self.__speed *= -1
 
-        if self.y - self.size / 2 < 0:
-            self.y = self.size / 2
-        elif self.y + self.size / 2 > self.game.screen_height:
-            self.y = self.game.screen_height - self.size / 2
+        if y - half < 0:
+            y = half
+        elif y + half > self._screen_height:
+            y = self._screen_height - half
+
+        self.x = x
+        self.y = y
 
         if self.hits_player():
             self.game.game_over_lose()
 
-    def render(self) -> None:
-        self.canvas.coords(self.__id, self.x - self.size / 2,
-                           self.y - self.size / 2, self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-    def delete(self) -> None:
-        self.canvas.delete(self.__id)
-
 
 # Complete the EnemyGenerator class by inserting code to generate enemies
 # based on the given game level; call TurtleAdventureGame's add_enemy() method
 # to add enemies to the game at certain points in time.
 #
-# Hint: the 'game' parameter is a tkinter's frame, so it's after()
-# method can be used to schedule some future events.
+# Hint: the generator's update() method is called once per game time step
+# with the elapsed time, so spawns can be paced by accumulating it.
 
 class EnemyGenerator:
     """
@@ -515,11 +561,36 @@ class EnemyGenerator:
     def __init__(self, game: "TurtleAdventureGame", level: int):
         self.__game: TurtleAdventureGame = game
         self.__level: int = level
-        self.__fencing_enemy_count: int = 0
-        self.__sin_enemy_count: int = 0
-
-        # example
-        self.__game.after(100, self.create_enemy)
+        # seconds between spawns, size, color and placement of each kind of
+        # enemy
+        self.__kinds: dict[type[Enemy],
+                           tuple[float, int, str, Callable[[Enemy], None]]] = {
+            DemoEnemy: (1.0, 20, "red", self.__place_demo),
+            RandomWalkEnemy: (0.5, 15, "pink", self.__place_random),
+            ChasingEnemy: (1.0, 30, "skyblue", self.__place_random),
+            FencingEnemy: (2.0, 10, "lightgreen", self.__place_on_fence),
+            SinEnemy: (1.5, 20, "Lightyellow", self.__place_sin),
+        }
+        # maximum number of enemies of each kind spawned over the whole game
+        self.__caps: dict[type[Enemy], int] = {
+            DemoEnemy: 5,
+            RandomWalkEnemy: 10 + level * 2,
+            ChasingEnemy: 3 + level,
+            FencingEnemy: 7,
+            SinEnemy: 10,
+        }
+        self.__spawned: dict[type[Enemy], int] = dict.fromkeys(self.__kinds,
+                                                               0)
+        # seconds accumulated toward the next spawn of each kind
+        self.__timers: dict[type[Enemy], float] = dict.fromkeys(self.__kinds,
+                                                                0.0)
+        # kinds still below their cap, fixed by the level up front so that
+        # update() only ever visits kinds that can still spawn
+        self.__pending: list[tuple[type[Enemy], float]] = [
+            (kind, interval)
+            for kind, (interval, _, _, _) in self.__kinds.items()
+            if self.__caps[kind] > 0
+        ]
 
     @property
     def game(self) -> "TurtleAdventureGame":
@@ -535,44 +606,48 @@ class EnemyGenerator:
         """
         return self.__level
 
-    def create_enemy(self) -> None:
+    def update(self, elapsed: float) -> None:
         """
-        Create a new enemy, possibly based on the game level
+        Advance the spawn timers by the elapsed time in seconds and create
+        the enemies that are due
         """
-        new_enemy = DemoEnemy(self.__game, 20, "red")
-        new_enemy.x = 100
-        new_enemy.y = 100
-        self.game.add_element(new_enemy)
-
-        randomwalk_enemy = RandomWalkEnemy(self.__game, 15, "pink")
-        randomwalk_enemy.x = random.randint(0, 800)
-        randomwalk_enemy.y = random.randint(0, 500)
-        self.game.add_element(randomwalk_enemy)
-
-        chasing_enemy = ChasingEnemy(self.__game, 30, "skyblue")
-        chasing_enemy.x = random.randint(0, 800)
-        chasing_enemy.y = random.randint(0, 500)
-        self.game.add_element(chasing_enemy)
+        capped = False
+        for kind, interval in self.__pending:
+            self.__timers[kind] += elapsed
+            if self.__timers[kind] >= interval:
+                self.__timers[kind] -= interval
+                self.create_enemy(kind)
+                capped = capped or self.__spawned[kind] >= self.__caps[kind]
+        if capped:
+            self.__pending = [(kind, interval)
+                              for kind, interval in self.__pending
+                              if self.__spawned[kind] < self.__caps[kind]]
 
-        if self.__fencing_enemy_count < 7:
-            fencing_enemy = FencingEnemy(self.__game, 10, "lightgreen")
-            fencing_enemy.x = self.game.home.x
-            fencing_enemy.y = self.game.home.y
-            self.game.add_element(fencing_enemy)
-            self.__fencing_enemy_count += 1
+    def create_enemy(self, kind: type[Enemy]) -> None:
+        """
+        Create a new enemy of the given kind, possibly based on the game level
+        """
+        _, size, color, place = self.__kinds[kind]
+        enemy = kind(self.game, size, color)
+        place(enemy)
+        self.game.add_enemy(enemy)
+        self.__spawned[kind] += 1
 
-        if self.__sin_enemy_count < 10:
-            random_x = random.randint(0, self.game.screen_width)
+    def __place_demo(self, enemy: Enemy) -> None:
+        enemy.x = 100
+        enemy.y = 100
 
-            sin_enemy = SinEnemy(self.__game, 20, "Lightyellow")
-            sin_enemy.x = random_x
-            sin_enemy.y = self.game.screen_height / 4
-            self.game.add_element(sin_enemy)
+    def __place_random(self, enemy: Enemy) -> None:
+        enemy.x = random.randint(0, self.game.screen_width)
+        enemy.y = random.randint(0, self.game.screen_height)
 
-            self.__sin_enemy_count += 1
+    def __place_sin(self, enemy: Enemy) -> None:
+        enemy.x = random.randint(0, self.game.screen_width)
+        enemy.y = self.game.screen_height / 4
 
-            # Call the method again for continuous enemy generation
-            self.__game.after(1000, self.create_enemy)
+    def __place_on_fence(self, enemy: Enemy) -> None:
+        # fencing enemies already start on the fence around home
+        pass
 
 
 class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
@@ -591,23 +666,20 @@ class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
         self.home: Home
         self.enemies: list[Enemy] = []
         self.enemy_generator: EnemyGenerator
+        self.__render_queue: list[str] = []
         super().__init__(parent)
 
     def init_game(self):
         self.canvas.config(width=self.screen_width, height=self.screen_height)
-        turtle = RawTurtle(self.canvas)
-        # set turtle screen's origin to the top-left corner
-        turtle.screen.setworldcoordinates(0, self.screen_height - 1,
-                                          self.screen_width - 1, 0)
-
-        self.waypoint = Waypoint(self)
-        self.add_element(self.waypoint)
         self.home = Home(self,
                          (self.screen_width - 100, self.screen_height // 2),
                          20)
         self.add_element(self.home)
-        self.player = Player(self, turtle)
+        self.player = Player(self)
         self.add_element(self.player)
+        # created last so the waypoint is stacked above home and player
+        self.waypoint = Waypoint(self)
+        self.add_element(self.waypoint)
         self.canvas.bind("<Button-1>",
                          lambda e: self.waypoint.activate(e.x, e.y))
 
@@ -623,6 +695,30 @@ class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
         self.enemies.append(enemy)
         self.add_element(enemy)
 
+    def update_game(self) -> None:
+        self.enemy_generator.update(self.time_step)
+
+    def queue_coords(self, item_id: int, x1: float, y1: float, x2: float,
+                     y2: float) -> None:
+        """
+        Queue new coordinates for a canvas item; queued changes are sent to
+        Tk together by flush_render()
+        """
+        self.__render_queue.append(
+            f"{self.canvas} coords {item_id} {x1} {y1} {x2} {y2}")
+
+    def flush_render(self) -> None:
+        """
+        Apply all queued canvas changes with a single Tcl evaluation
+        """
+        if self.__render_queue:
+            self.canvas.tk.eval("\n".join(self.__render_queue))
+            self.__render_queue.clear()
+
+    def animate(self):
+        super().animate()
+        self.flush_render()
+
     def game_over_win(self) -> None:
         """
         Called when the player wins the game and stop the game